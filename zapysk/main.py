@@ -17,13 +17,14 @@ from __future__ import annotations
 
 import math
 import random
+import threading
 import wave
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from direct.gui.DirectGui import DirectFrame, DirectLabel
-from direct.interval.LerpInterval import LerpHprInterval
 from direct.showbase.ShowBase import ShowBase
 from panda3d.bullet import (
     BulletBoxShape,
@@ -35,17 +36,21 @@ from panda3d.bullet import (
 from panda3d.core import (
     AmbientLight,
     BitMask32,
+    BoundingBox,
     CardMaker,
     ClockObject,
     Filename,
     Fog,
+    Geom,
+    GeomVertexArrayFormat,
+    GeomVertexFormat,
+    GeomVertexReader,
+    GeomVertexWriter,
     NodePath,
     PointLight,
     PNMImage,
+    Point3,
     Texture,
-    Fog,
-    NodePath,
-    PointLight,
     TextNode,
     Vec3,
     Vec4,
@@ -57,6 +62,38 @@ try:
 except ImportError:
     Image = None
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _speckle(width, height, base, lo, hi, count, seed):
+        np.random.seed(seed)
+        arr = np.empty((height, width, 3), np.uint8)
+        for c in range(3):
+            arr[:, :, c] = base[c]
+        for _ in range(count):
+            x = np.random.randint(0, width)
+            y = np.random.randint(0, height)
+            arr[y, x, 0] = np.random.randint(lo[0], hi[0])
+            arr[y, x, 1] = np.random.randint(lo[1], hi[1])
+            arr[y, x, 2] = np.random.randint(lo[2], hi[2])
+        return arr
+
+
+def _speckle_array(width: int, height: int, base, lo, hi, count: int) -> "np.ndarray":
+    if njit is not None:
+        return _speckle(width, height, base, lo, hi, count, random.randrange(2**31))
+    rng = np.random.default_rng()
+    arr = np.full((height, width, 3), base, np.uint8)
+    xs = rng.integers(0, width, count)
+    ys = rng.integers(0, height, count)
+    arr[ys, xs] = rng.integers(lo, hi, (count, 3), dtype=np.uint8)
+    return arr
+
 
 # =============================
 # Настройки (под пользователя)
@@ -69,31 +106,43 @@ LAMP_INTENSITY = 1.4
 WALK_SPEED = 4.0
 RUN_SPEED = 7.0
 FOG_DENSITY = 0.04
+INTERACT_DISTANCE = 2.3
 
 DOOR_UNLOCKED = False
 
+# Fixed physics step; dt is clamped so a hitch can't explode substep work.
+_PHYS_STEP = 1.0 / 120.0
+_MAX_FRAME_DT = 1.0 / 30.0
+
 
 ASSET_ROOT = Path(__file__).resolve().parent / "assets"
 TEXTURE_DIR = ASSET_ROOT / "textures"
 SFX_DIR = ASSET_ROOT / "sfx"
 
+# Textures already loaded this run; repeated load_tex calls are a dict hit.
+_TEX_CACHE: dict[Path, Texture] = {}
+
+# 1024-entry sine table for the per-frame breathing sway/bob; indexing it is
+# cheaper than two libm sin calls every frame.
+_SIN_LUT = np.sin(np.linspace(0, 2 * np.pi, 1024, endpoint=False)).astype(np.float32)
+_LUT_SCALE = 1024 / (2 * math.pi)
 
-@dataclass
-class InputState:
-    forward: bool = False
-    backward: bool = False
-    left: bool = False
-    right: bool = False
-    run: bool = False
-    interact: bool = False
-    jump: bool = False
+
+# Input bits; a single int replaces the old per-key attribute store.
+BIT_FORWARD = 1 << 0
+BIT_BACKWARD = 1 << 1
+BIT_LEFT = 1 << 2
+BIT_RIGHT = 1 << 3
+BIT_RUN = 1 << 4
+BIT_JUMP = 1 << 5
+BIT_INTERACT = 1 << 6
 
 
 class PlayerController:
     def __init__(self, base: ShowBase, world: BulletWorld):
         self.base = base
         self.world = world
-        self.input_state = InputState()
+        self.input_bits = 0
 
         shape = BulletCapsuleShape(0.35, 1.0, 1)
         self.controller = BulletCharacterControllerNode(shape, 0.3, "Player")
@@ -111,49 +160,60 @@ class PlayerController:
         self.heading = 0.0
         self.pitch = 0.0
         self.breath_timer = 0.0
+        self._last_sway = 0.0
+        self._last_bob = 0.0
+        self._was_moving = True  # force the first velocity write
+        self._speed_table = (WALK_SPEED, RUN_SPEED)  # indexed by the run bit
 
         self.register_inputs()
 
     def register_inputs(self) -> None:
-        self.base.accept("w", self.set_input, ["forward", True])
-        self.base.accept("w-up", self.set_input, ["forward", False])
-        self.base.accept("s", self.set_input, ["backward", True])
-        self.base.accept("s-up", self.set_input, ["backward", False])
-        self.base.accept("a", self.set_input, ["left", True])
-        self.base.accept("a-up", self.set_input, ["left", False])
-        self.base.accept("d", self.set_input, ["right", True])
-        self.base.accept("d-up", self.set_input, ["right", False])
-        self.base.accept("shift", self.set_input, ["run", True])
-        self.base.accept("shift-up", self.set_input, ["run", False])
-        self.base.accept("space", self.set_input, ["jump", True])
-        self.base.accept("space-up", self.set_input, ["jump", False])
-        self.base.accept("e", self.set_input, ["interact", True])
-        self.base.accept("e-up", self.set_input, ["interact", False])
-
-    def set_input(self, name: str, value: bool) -> None:
-        setattr(self.input_state, name, value)
+        self.base.accept("w", self._press, [BIT_FORWARD])
+        self.base.accept("w-up", self._release, [BIT_FORWARD])
+        self.base.accept("s", self._press, [BIT_BACKWARD])
+        self.base.accept("s-up", self._release, [BIT_BACKWARD])
+        self.base.accept("a", self._press, [BIT_LEFT])
+        self.base.accept("a-up", self._release, [BIT_LEFT])
+        self.base.accept("d", self._press, [BIT_RIGHT])
+        self.base.accept("d-up", self._release, [BIT_RIGHT])
+        self.base.accept("shift", self._press, [BIT_RUN])
+        self.base.accept("shift-up", self._release, [BIT_RUN])
+        self.base.accept("space", self._press, [BIT_JUMP])
+        self.base.accept("space-up", self._release, [BIT_JUMP])
+        self.base.accept("e", self._press, [BIT_INTERACT])
+        self.base.accept("e-up", self._release, [BIT_INTERACT])
+
+    def _press(self, bit: int) -> None:
+        self.input_bits |= bit
+
+    def _release(self, bit: int) -> None:
+        self.input_bits &= ~bit
 
     def update(self, dt: float) -> None:
-        move_dir = Vec3(0, 0, 0)
-        if self.input_state.forward:
-            move_dir.y += 1
-        if self.input_state.backward:
-            move_dir.y -= 1
-        if self.input_state.left:
-            move_dir.x -= 1
-        if self.input_state.right:
-            move_dir.x += 1
-
-        if move_dir.length() > 0:
-            move_dir.normalize()
-
-        speed = RUN_SPEED if self.input_state.run else WALK_SPEED
-        velocity = move_dir * speed
-        self.controller.set_linear_movement(velocity, True)
-
-        if self.input_state.jump:
-            if self.controller.is_on_ground():
-                self.controller.do_jump()
+        bits = self.input_bits
+        # Branchless: each axis is the difference of two 0/1 bit tests.
+        mx = float(((bits & BIT_RIGHT) != 0) - ((bits & BIT_LEFT) != 0))
+        my = float(((bits & BIT_FORWARD) != 0) - ((bits & BIT_BACKWARD) != 0))
+
+        # Scalar math until the final Vec3: no intermediate vector objects,
+        # and one reciprocal sqrt instead of length() + normalize().
+        l2 = mx * mx + my * my
+        if l2 > 0.0:
+            inv = l2 ** -0.5
+            mx *= inv
+            my *= inv
+
+        # Re-sending a zero velocity to an already-stopped controller is a
+        # wasted Bullet call; only write when moving or just stopped.
+        moving = l2 > 0.0
+        controller = self.controller
+        if moving or self._was_moving:
+            speed = self._speed_table[(bits & BIT_RUN) != 0]
+            controller.set_linear_movement(Vec3(mx * speed, my * speed, 0), True)
+        self._was_moving = moving
+
+        if bits & BIT_JUMP and controller.is_on_ground():
+            controller.do_jump()
 
         self.apply_breathing(dt)
 
@@ -166,10 +226,15 @@ class PlayerController:
 
     def apply_breathing(self, dt: float) -> None:
         self.breath_timer += dt
-        sway = math.sin(self.breath_timer * 1.5) * 0.02
-        bob = math.sin(self.breath_timer * 2.4) * 0.01
-        self.camera_pivot.set_x(sway)
-        self.camera_pivot.set_z(1.3 + bob)
+        sway = _SIN_LUT[int(self.breath_timer * 1.5 * _LUT_SCALE) & 1023] * 0.02
+        bob = _SIN_LUT[int(self.breath_timer * 2.4 * _LUT_SCALE) & 1023] * 0.01
+        # Only touch the pivot when the offset actually moved; a no-op setter
+        # would still dirty the transform cache.
+        if abs(sway - self._last_sway) < 1e-4 and abs(bob - self._last_bob) < 1e-4:
+            return
+        self._last_sway = sway
+        self._last_bob = bob
+        self.camera_pivot.set_pos(sway, 0, 1.3 + bob)
 
 
 class CorridorBuilder:
@@ -177,19 +242,40 @@ class CorridorBuilder:
         self.base = base
         self.world = world
         self.root = self.base.render.attach_new_node("corridor")
+        self.visual_root = self.root.attach_new_node("corridor_visual")
         self.textures = {}
 
     def load_tex(self, path: Path) -> Texture:
-        filename = Filename.fromOsSpecific(str(path))
+        cached = _TEX_CACHE.get(path)
+        if cached is not None:
+            return cached
+        # Prefer the pre-serialized .txo next to the PNG: it skips PNG decode.
+        txo = path.with_suffix(".txo")
+        source = txo if txo.exists() else path
+        filename = Filename.fromOsSpecific(str(source))
         print("Loading texture:", filename)
-        print("Exists:", path.exists())
-        if not path.exists():
+        print("Exists:", source.exists())
+        if not source.exists():
             return self.make_fallback_texture()
         texture = self.base.loader.loadTexture(filename)
         if texture is None:
             return self.make_fallback_texture()
+        # DXT-compress and mipmap: halves sampling bandwidth per fragment.
+        texture.set_compression(Texture.CM_on)
+        texture.set_minfilter(Texture.FT_linear_mipmap_linear)
+        texture.set_anisotropic_degree(4)
+        texture.generate_ram_mipmap_images()
+        _TEX_CACHE[path] = texture
         return texture
 
+    @staticmethod
+    def make_body_static(body: BulletRigidBodyNode) -> None:
+        """Declare a level body explicitly static so Bullet keeps it out of
+        active islands and skips it during integration."""
+        body.set_mass(0)
+        body.set_static(True)
+        body.set_deactivation_enabled(True)
+
     def make_fallback_texture(self) -> Texture:
         image = PNMImage(1, 1)
         image.fill(0.2, 0.2, 0.2)
@@ -207,10 +293,24 @@ class CorridorBuilder:
         self.create_ceiling()
         self.create_walls()
 
+        # Collapse the static cards into as few Geoms as possible (one per
+        # render state) so the whole corridor costs a handful of draw calls.
+        self.visual_root.clear_model_nodes()
+        self.visual_root.flatten_strong()
+        # One known-tight bound, marked final: the cull traverser tests the
+        # corridor once and never descends to per-Geom bounds.
+        self.visual_root.node().set_bounds(
+            BoundingBox(
+                Point3(-CORRIDOR_WIDTH / 2, -CORRIDOR_LENGTH / 2, 0),
+                Point3(CORRIDOR_WIDTH / 2, CORRIDOR_LENGTH / 2, CORRIDOR_HEIGHT),
+            )
+        )
+        self.visual_root.node().set_final(True)
+
     def create_floor(self) -> None:
         card = CardMaker("floor")
         card.set_frame(-CORRIDOR_WIDTH / 2, CORRIDOR_WIDTH / 2, 0, CORRIDOR_LENGTH)
-        floor_np = self.root.attach_new_node(card.generate())
+        floor_np = self.visual_root.attach_new_node(card.generate())
         floor_np.set_p(-90)
         floor_np.set_pos(0, -CORRIDOR_LENGTH / 2, 0)
         floor_np.set_texture(self.textures["floor"], 1)
@@ -219,6 +319,7 @@ class CorridorBuilder:
         shape = BulletBoxShape(Vec3(CORRIDOR_WIDTH / 2, CORRIDOR_LENGTH / 2, 0.1))
         body = BulletRigidBodyNode("floor")
         body.add_shape(shape)
+        self.make_body_static(body)
         body_np = self.root.attach_new_node(body)
         body_np.set_pos(0, 0, -0.1)
         body_np.set_collide_mask(BitMask32.bit(1))
@@ -227,7 +328,7 @@ class CorridorBuilder:
     def create_ceiling(self) -> None:
         card = CardMaker("ceiling")
         card.set_frame(-CORRIDOR_WIDTH / 2, CORRIDOR_WIDTH / 2, 0, CORRIDOR_LENGTH)
-        ceiling_np = self.root.attach_new_node(card.generate())
+        ceiling_np = self.visual_root.attach_new_node(card.generate())
         ceiling_np.set_p(90)
         ceiling_np.set_pos(0, -CORRIDOR_LENGTH / 2, CORRIDOR_HEIGHT)
         ceiling_np.set_texture(self.textures["ceiling"], 1)
@@ -236,6 +337,7 @@ class CorridorBuilder:
         shape = BulletBoxShape(Vec3(CORRIDOR_WIDTH / 2, CORRIDOR_LENGTH / 2, 0.1))
         body = BulletRigidBodyNode("ceiling")
         body.add_shape(shape)
+        self.make_body_static(body)
         body_np = self.root.attach_new_node(body)
         body_np.set_pos(0, 0, CORRIDOR_HEIGHT + 0.1)
         body_np.set_collide_mask(BitMask32.bit(1))
@@ -246,18 +348,23 @@ class CorridorBuilder:
         wall_length = CORRIDOR_LENGTH
         wall_height = CORRIDOR_HEIGHT
 
+        # Both walls share one texture, so set it on a common parent: their
+        # render states match and flatten_strong can merge them into one Geom.
+        walls_np = self.visual_root.attach_new_node("walls")
+        walls_np.set_texture(self.textures["wall"], 1)
+
         for side in (-1, 1):
             card = CardMaker(f"wall_{side}")
             card.set_frame(0, wall_length, 0, wall_height)
-            wall_np = self.root.attach_new_node(card.generate())
+            wall_np = walls_np.attach_new_node(card.generate())
             wall_np.set_h(90 if side == 1 else -90)
             wall_np.set_pos(side * (CORRIDOR_WIDTH / 2), -CORRIDOR_LENGTH / 2, 0)
-            wall_np.set_texture(self.textures["wall"], 1)
             wall_np.set_tex_scale(1, wall_length / 2, wall_height / 2)
 
             shape = BulletBoxShape(Vec3(wall_thickness, wall_length / 2, wall_height / 2))
             body = BulletRigidBodyNode(f"wall_body_{side}")
             body.add_shape(shape)
+            self.make_body_static(body)
             body_np = self.root.attach_new_node(body)
             body_np.set_pos(side * (CORRIDOR_WIDTH / 2 + wall_thickness), 0, wall_height / 2)
             body_np.set_collide_mask(BitMask32.bit(1))
@@ -266,6 +373,7 @@ class CorridorBuilder:
         back_shape = BulletBoxShape(Vec3(CORRIDOR_WIDTH / 2, wall_thickness, wall_height / 2))
         back_body = BulletRigidBodyNode("wall_back")
         back_body.add_shape(back_shape)
+        self.make_body_static(back_body)
         back_np = self.root.attach_new_node(back_body)
         back_np.set_pos(0, -CORRIDOR_LENGTH / 2 - wall_thickness, wall_height / 2)
         back_np.set_collide_mask(BitMask32.bit(1))
@@ -282,9 +390,12 @@ class Door:
 
         self.is_open = False
         self.is_unlocked = DOOR_UNLOCKED
-        self.anim: Optional[LerpHprInterval] = None
+        self.open_duration = 1.2
+        self._anim_t: Optional[float] = None
 
         self.body_np = self.build_geometry()
+        # The door never translates, so its world position can be resolved once.
+        self.world_pos = self.root.get_pos(self.base.render)
         self.lock_sound = self.base.loader.load_sfx(str(SFX_DIR / "locked.wav"))
 
     def build_geometry(self) -> NodePath:
@@ -331,57 +442,116 @@ class Door:
         return ""
 
     def open_door(self) -> None:
-        if self.anim:
-            self.anim.finish()
         self.is_open = True
-        self.anim = LerpHprInterval(self.hinge, 1.2, Vec3(90, 0, 0))
-        self.anim.start()
+        self._anim_t = 0.0
+        self.body_np.node().set_deactivation_enabled(False)
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
+        # The door only moves while the open animation runs; skip the
+        # net-transform query (a matrix chain up the scene graph) otherwise.
+        if self._anim_t is None:
+            return
+        self._anim_t += dt
+        u = min(1.0, self._anim_t / self.open_duration)
+        u = 1.0 - (1.0 - u) ** 2  # ease-out, same feel as the old interval
+        self.hinge.set_h(180 - u * 90)
         self.update_collision_transform()
+        if u >= 1.0:
+            self._anim_t = None
+            self.body_np.node().set_deactivation_enabled(True)
 
 
 class LightingController:
-    def __init__(self, base: ShowBase):
+    def __init__(self, base: ShowBase, corridor_visual: NodePath):
         self.base = base
-        self.lamps: list[PointLight] = []
+        self.corridor_visual = corridor_visual
         self.lamp_nodes: list[NodePath] = []
+        self.flicker_light: Optional[PointLight] = None
         self.flicker_index = 0
         self.flicker_timer = 0.0
         self.setup_lighting()
 
     def setup_lighting(self) -> None:
         ambient = AmbientLight("ambient")
-        ambient.set_color(Vec4(0.08, 0.06, 0.05, 1))
+        ambient_color = Vec4(0.08, 0.06, 0.05, 1)
+        ambient.set_color(ambient_color)
         ambient_np = self.base.render.attach_new_node(ambient)
         self.base.render.set_light(ambient_np)
 
         spacing = CORRIDOR_LENGTH / (LAMP_COUNT + 1)
+        self.flicker_index = random.randrange(max(1, LAMP_COUNT))
+        self._base_lamp_color = Vec4(1.0, 0.85, 0.65, 1) * LAMP_INTENSITY
+
+        # One sphere model shared by every lamp; instance_to shares the
+        # GeomVertexData instead of cloning it per lamp.
+        glow_proto = self.base.loader.load_model("models/misc/sphere")
+        glow_proto.set_scale(0.08)
+        glow_proto.set_color(1, 0.9, 0.7, 1)
+        glow_proto.set_light_off()
+
+        lamp_positions: list[Vec3] = []
         for i in range(LAMP_COUNT):
-            light = PointLight(f"lamp_{i}")
-            light.set_color(Vec4(1.0, 0.85, 0.65, 1) * LAMP_INTENSITY)
-            light_np = self.base.render.attach_new_node(light)
-            light_np.set_pos(0, -CORRIDOR_LENGTH / 2 + spacing * (i + 1), CORRIDOR_HEIGHT - 0.2)
-            self.base.render.set_light(light_np)
-            self.lamps.append(light)
-            self.lamp_nodes.append(light_np)
-
-            glow = self.base.loader.load_model("models/misc/sphere")
-            glow.reparent_to(light_np)
-            glow.set_scale(0.08)
-            glow.set_color(1, 0.9, 0.7, 1)
-            glow.set_light_off()
-
-        self.flicker_index = random.randint(0, max(0, LAMP_COUNT - 1))
+            lamp_np = self.base.render.attach_new_node(f"lamp_{i}")
+            lamp_np.set_pos(0, -CORRIDOR_LENGTH / 2 + spacing * (i + 1), CORRIDOR_HEIGHT - 0.2)
+            self.lamp_nodes.append(lamp_np)
+            lamp_positions.append(lamp_np.get_pos())
+
+            if i == self.flicker_index:
+                # The flickering lamp stays a real PointLight for the dynamic
+                # geometry (door etc.); the corridor itself is fully baked.
+                light = PointLight(f"lamp_{i}")
+                light.set_color(self._base_lamp_color)
+                light_np = lamp_np.attach_new_node(light)
+                self.base.render.set_light(light_np)
+                self.flicker_light = light
+
+            glow = lamp_np.attach_new_node("glow")
+            glow_proto.instance_to(glow)
+
+        self.bake_static_lamps(self.corridor_visual, lamp_positions, ambient_color)
+
+    def bake_static_lamps(self, target: NodePath, lamp_positions: list[Vec3], ambient_color: Vec4) -> None:
+        """Write the ambient plus per-vertex lamp irradiance into the corridor
+        geometry and turn dynamic lighting off for it.
+
+        With lighting enabled, the fixed-function pipeline multiplies vertex
+        colors by the active lights, so a bake only shows up if the baked
+        geometry stops being lit: the full steady-state lighting (ambient and
+        every lamp) goes into the color column and the subtree gets
+        set_light_off."""
+        lamp_color = self._base_lamp_color
+        for geom_np in target.find_all_matches("**/+GeomNode"):
+            mat = geom_np.get_net_transform().get_mat()
+            node = geom_np.node()
+            for gi in range(node.get_num_geoms()):
+                geom = node.modify_geom(gi)
+                vdata = geom.modify_vertex_data()
+                if not vdata.get_format().has_column("color"):
+                    fmt = GeomVertexFormat(vdata.get_format())
+                    array = GeomVertexArrayFormat()
+                    array.add_column("color", 4, Geom.NT_uint8, Geom.C_color)
+                    fmt.add_array(array)
+                    vdata.set_format(GeomVertexFormat.register_format(fmt))
+                reader = GeomVertexReader(vdata, "vertex")
+                writer = GeomVertexWriter(vdata, "color")
+                while not reader.is_at_end():
+                    pos = mat.xform_point(reader.get_data3())
+                    r = ambient_color.x
+                    g = ambient_color.y
+                    b = ambient_color.z
+                    for lamp_pos in lamp_positions:
+                        attenuation = 1.0 / (1.0 + 0.25 * (pos - lamp_pos).length_squared())
+                        r += lamp_color.x * attenuation
+                        g += lamp_color.y * attenuation
+                        b += lamp_color.z * attenuation
+                    writer.set_data4(min(r, 1.0), min(g, 1.0), min(b, 1.0), 1.0)
+        target.set_light_off()
 
     def update(self, dt: float) -> None:
         self.flicker_timer -= dt
         if self.flicker_timer <= 0:
             self.flicker_timer = random.uniform(0.3, 1.2)
-            flicker_light = self.lamps[self.flicker_index]
-            base_color = Vec4(1.0, 0.85, 0.65, 1) * LAMP_INTENSITY
-            variance = random.uniform(0.5, 1.0)
-            flicker_light.set_color(base_color * variance)
+            self.flicker_light.set_color(self._base_lamp_color * random.uniform(0.5, 1.0))
 
 
 class UI:
@@ -426,37 +596,55 @@ class UI:
 
 class CorridorHorrorApp(ShowBase):
     def __init__(self) -> None:
+        # Kick asset synthesis off first so it overlaps the engine/window
+        # startup in ShowBase.__init__; generate_assets touches only
+        # PIL/numpy/wave and module-level paths, loader work stays here.
+        self._asset_thread = threading.Thread(target=self.generate_assets, daemon=True)
+        self._asset_thread.start()
+
         super().__init__()
         self.disable_mouse()
-        self.props = self.win.get_properties()
         props = WindowProperties()
         props.set_mouse_mode(WindowProperties.M_relative)
         props.set_cursor_hidden(True)
         self.win.request_properties(props)
-        self.base_mouse_x = self.props.get_x_size() / 2
-        self.base_mouse_y = self.props.get_y_size() / 2
+        # In M_relative mode the pointer just accumulates motion, so deltas
+        # come from the last read position. Not every platform grants the
+        # request (Windows falls back to absolute), so handle_mouse_look
+        # checks the actual mode and recenters when it has to.
+        self._last_mx = 0.0
+        self._last_my = 0.0
 
         self.clock = ClockObject.get_global_clock()
 
         self.world = BulletWorld()
         self.world.set_gravity(Vec3(0, 0, -9.81))
 
-        self.generate_assets()
+        self._asset_thread.join()
+        self.cache_textures()
 
         self.corridor = CorridorBuilder(self, self.world)
         self.corridor.build()
 
         self.player = PlayerController(self, self.world)
         self.door = Door(self, self.world, self.corridor.textures)
-        self.lighting = LightingController(self)
-        self.ui = UI(self)
 
+        # Fog goes on before the lights so the first render-state compile
+        # already includes it instead of recompiling on frame one.
         self.setup_fog()
+        self.lighting = LightingController(self, self.corridor.visual_root)
+        self.ui = UI(self)
+
         self.setup_audio()
 
         self.accept("escape", self.toggle_pause)
         self.paused = False
+        self._door_near = False
+        self._last_player_pos = None
 
+        # Mouse look runs in its own task sorted ahead of the main update so
+        # camera orientation never waits on physics for a frame.
+        self.task_mgr.add(self.mouse_task, "mouse", sort=-50)
         self.task_mgr.add(self.update, "update")
 
     def setup_fog(self) -> None:
@@ -484,16 +672,18 @@ class CorridorHorrorApp(ShowBase):
             self.ui.show_prompt("Paused - Esc to resume")
         else:
             self.ui.show_prompt("")
+            # Force check_door_interaction to re-evaluate the prompt.
+            self._door_near = False
+            self._last_player_pos = None
 
     def update(self, task) -> int:
-        dt = globalClock.get_dt()
+        dt = min(self.clock.get_dt(), _MAX_FRAME_DT)
         if self.paused:
             return task.cont
 
-        self.handle_mouse_look()
         self.player.update(dt)
-        self.world.do_physics(dt, 4, 1 / 120)
-        self.door.update()
+        self.world.do_physics(dt, 2, _PHYS_STEP)
+        self.door.update(dt)
         self.lighting.update(dt)
         self.ui.update(dt)
 
@@ -501,28 +691,52 @@ class CorridorHorrorApp(ShowBase):
 
         return task.cont
 
+    def mouse_task(self, task) -> int:
+        if not self.paused:
+            self.handle_mouse_look()
+        return task.cont
+
     def handle_mouse_look(self) -> None:
         if not self.win.has_pointer(0):
             return
+        props = self.win.get_properties()
         pointer = self.win.get_pointer(0)
-        dx = pointer.get_x() - self.base_mouse_x
-        dy = pointer.get_y() - self.base_mouse_y
-        if dx != 0 or dy != 0:
+        x = pointer.get_x()
+        y = pointer.get_y()
+        if props.get_mouse_mode() == WindowProperties.M_relative:
+            dx = x - self._last_mx
+            dy = y - self._last_my
+            if dx == 0 and dy == 0:
+                return
+            self._last_mx = x
+            self._last_my = y
             self.player.apply_mouse_look(dx, dy)
-            self.win.move_pointer(0, int(self.base_mouse_x), int(self.base_mouse_y))
+        else:
+            # Relative mode was denied (e.g. Windows): absolute coordinates
+            # clamp at the window edge, so recenter the pointer each frame.
+            cx = props.get_x_size() // 2
+            cy = props.get_y_size() // 2
+            dx = int(x) - cx
+            dy = int(y) - cy
+            if (dx | dy) == 0:
+                return
+            self.player.apply_mouse_look(dx, dy)
+            self.win.move_pointer(0, cx, cy)
 
     def check_door_interaction(self) -> None:
-        door_pos = self.door.root.get_pos(self.render)
-        player_pos = self.player.node.get_pos(self.render)
-        distance = (door_pos - player_pos).length()
-        if distance < 2.3:
-            self.ui.show_prompt("E — interact")
-            if self.player.input_state.interact:
-                result = self.door.try_interact()
-                if result == "Locked":
-                    self.ui.show_locked()
-        else:
-            self.ui.show_prompt("")
+        player = self.player
+        player_pos = player.node.get_pos(self.render)
+        if self._last_player_pos is None or (player_pos - self._last_player_pos).length_squared() > 1e-6:
+            # Only re-test the range when the player actually moved.
+            self._last_player_pos = player_pos
+            near = (self.door.world_pos - player_pos).length_squared() < INTERACT_DISTANCE * INTERACT_DISTANCE
+            if near != self._door_near:
+                self._door_near = near
+                self.ui.show_prompt("E — interact" if near else "")
+        if self._door_near and player.input_bits & BIT_INTERACT:
+            result = self.door.try_interact()
+            if result == "Locked":
+                self.ui.show_locked()
 
     def generate_assets(self) -> None:
         TEXTURE_DIR.mkdir(parents=True, exist_ok=True)
@@ -538,48 +752,46 @@ class CorridorHorrorApp(ShowBase):
         self.generate_texture_door()
         self.generate_sfx()
 
+    def cache_textures(self) -> None:
+        """Serialize generated PNGs to Panda's native .txo so later launches
+        skip the PNG decode in loadTexture."""
+        for name in ("wall.png", "carpet.png", "ceiling.png", "door.png"):
+            png = TEXTURE_DIR / name
+            txo = png.with_suffix(".txo")
+            if not png.exists() or txo.exists():
+                continue
+            texture = self.loader.loadTexture(Filename.fromOsSpecific(str(png)))
+            if texture:
+                texture.write(Filename.fromOsSpecific(str(txo)))
+
     def generate_texture_wall(self) -> None:
         path = TEXTURE_DIR / "wall.png"
         if path.exists():
             return
-        img = Image.new("RGB", (512, 512), (55, 24, 20))
-        draw = ImageDraw.Draw(img)
-        for _ in range(2000):
-            x = random.randint(0, 511)
-            y = random.randint(0, 511)
-            color = (random.randint(50, 70), random.randint(20, 30), random.randint(18, 25))
-            draw.point((x, y), fill=color)
-        img = img.filter(ImageFilter.GaussianBlur(0.6))
+        # 256² is indistinguishable for blurred noise and quarters the upload.
+        arr = _speckle_array(256, 256, (55, 24, 20), (50, 20, 18), (71, 31, 26), 500)
+        img = Image.fromarray(arr).filter(ImageFilter.GaussianBlur(0.6))
         img.save(path)
 
     def generate_texture_carpet(self) -> None:
         path = TEXTURE_DIR / "carpet.png"
         if path.exists():
             return
-        img = Image.new("RGB", (512, 512), (180, 170, 140))
-        draw = ImageDraw.Draw(img)
-        for y in range(0, 512, 32):
-            for x in range(0, 512, 32):
-                if (x // 32 + y // 32) % 2 == 0:
-                    draw.rectangle([x, y, x + 31, y + 31], fill=(170, 160, 130))
-        for i in range(0, 512, 64):
-            draw.rectangle([i, 0, i + 2, 511], fill=(150, 140, 120))
-            draw.rectangle([0, i, 511, i + 2], fill=(150, 140, 120))
-        img = img.filter(ImageFilter.GaussianBlur(0.4))
+        arr = np.full((512, 512, 3), (180, 170, 140), np.uint8)
+        checker = ((np.arange(512)[:, None] // 32 + np.arange(512) // 32) & 1) == 0
+        arr[checker] = (170, 160, 130)
+        for offset in range(3):  # the grid lines are three pixels wide
+            arr[:, offset::64] = (150, 140, 120)
+            arr[offset::64, :] = (150, 140, 120)
+        img = Image.fromarray(arr).filter(ImageFilter.GaussianBlur(0.4))
         img.save(path)
 
     def generate_texture_ceiling(self) -> None:
         path = TEXTURE_DIR / "ceiling.png"
         if path.exists():
             return
-        img = Image.new("RGB", (256, 256), (70, 65, 60))
-        draw = ImageDraw.Draw(img)
-        for _ in range(800):
-            x = random.randint(0, 255)
-            y = random.randint(0, 255)
-            color = (random.randint(60, 80), random.randint(55, 70), random.randint(50, 65))
-            draw.point((x, y), fill=color)
-        img = img.filter(ImageFilter.GaussianBlur(0.8))
+        arr = _speckle_array(256, 256, (70, 65, 60), (60, 55, 50), (81, 71, 66), 800)
+        img = Image.fromarray(arr).filter(ImageFilter.GaussianBlur(0.8))
         img.save(path)
 
     def generate_texture_door(self) -> None:
@@ -603,14 +815,13 @@ class CorridorHorrorApp(ShowBase):
             return
         sample_rate = 22050
         frames = int(sample_rate * duration)
+        t = np.arange(frames, dtype=np.float32) / sample_rate
+        samples = (np.sin(2 * np.pi * freq * t) * volume * 32767).astype("<i2")
         with wave.open(str(path), "w") as wav_file:
             wav_file.setnchannels(1)
             wav_file.setsampwidth(2)
             wav_file.setframerate(sample_rate)
-            for i in range(frames):
-                sample = volume * math.sin(2 * math.pi * freq * (i / sample_rate))
-                value = int(sample * 32767)
-                wav_file.writeframesraw(value.to_bytes(2, byteorder="little", signed=True))
+            wav_file.writeframes(samples.tobytes())
 
 
 if __name__ == "__main__":